@@ -1,98 +1,423 @@
 #!/usr/bin/env python3
 
 import yaml
+import bisect
+import collections
+import copy
+import dataclasses
 import getopt
+import glob
+import itertools
+import math
 import os
 import re
+import select
+import shlex
+import socket
 import sensors  # https://github.com/bastienleonard/pysensors.git
 import subprocess
 import sys
+import tempfile
+import threading
 import time
 import signal
 
-def get_amd_temperatures() -> list[int]:
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml based, when PyYAML was built with it
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    import pynvml  # https://pypi.org/project/nvidia-ml-py/
+except ImportError:
+    pynvml = None
+
+# NVML device handles, cached once by init_nvml() (None until initialized)
+_nvml_handles = None
+# Seconds to wait before retrying a failed NVML initialization (driver not loaded yet, reloaded...)
+NVML_RETRY_INTERVAL = 300
+_nvml_retry_at = 0.0
+
+# Long-running 'nvidia-smi -lms' process, used when pynvml is not installed
+_nvsmi_proc = None
+_nvsmi_buffer = b''
+_nvsmi_temps = {}  # GPU index -> last reported temperature
+_nvsmi_last_sample = 0.0
+# After nvidia-smi failed, it is restarted only after a delay, doubling up to NVSMI_MAX_RESTART_DELAY seconds
+NVSMI_MAX_RESTART_DELAY = 300
+_nvsmi_restart_delay = 0.0
+_nvsmi_restart_at = 0.0
+# One '<index>, <temperature>' sample line of the nvidia-smi output
+_NVSMI_SAMPLE_RE = re.compile(rb'^[ \t]*(\d+)[ \t]*,[ \t]*(\S*)[ \t]*$', re.MULTILINE)
+
+# libsensors is initialized when the sensors module is imported, until cleanup_sensors()
+_sensors_inited = True
+# Set by SIGHUP, the main loop then reloads the configuration and the chips before its next tick
+_reload_requested = False
+# SIGHUP writes to this pipe to wake the main loop up from its wait for the next tick
+_wakeup_read, _wakeup_write = os.pipe()
+os.set_blocking(_wakeup_read, False)
+os.set_blocking(_wakeup_write, False)
+
+# (chip, subfeature number) pairs of temperature inputs, cached once by init_sensors()
+_coretemp_subs = []
+_amdgpu_subs = None
+
+# sysfs temperature inputs of AMD GPUs (millidegrees Celsius), cached once by init_sensors()
+HWMON_PATH = '/sys/class/hwmon'
+_amdgpu_hwmon_paths = []
+
+def init_sensors():
     """
-    Fetch AMD GPU temperatures using sensors library.
-    Returns a list of temperatures (or empty list if no AMD GPUs detected or errors occur).
-    Errors are printed to stderr.
+    Enumerate the detected chips once and cache the temperature input
+    subfeatures of CPU cores (coretemp) and AMD GPUs (amdgpu), so that
+    the control loop only has to call get_value() on each of them.
     """
-    amd_temps = []
+    global _coretemp_subs, _amdgpu_subs, _amdgpu_hwmon_paths
+    _coretemp_subs = []
+    _amdgpu_subs = []
+    _amdgpu_hwmon_paths = []
+    try:
+        for name_path in sorted(glob.glob(os.path.join(HWMON_PATH, 'hwmon*', 'name'))):
+            with open(name_path) as name_file:
+                if name_file.read().strip() != 'amdgpu':
+                    continue
+            _amdgpu_hwmon_paths += sorted(glob.glob(os.path.join(os.path.dirname(name_path), 'temp*_input')))
+    except OSError as e:
+        print(f"Warning: Error scanning {HWMON_PATH} for AMD GPUs: {str(e)}", file=sys.stderr)
     try:
         for sensor in sensors.get_detected_chips():
             # Use 'amdgpu' only (k10temp is for AMD CPUs, not GPUs)
-            if sensor.prefix == 'amdgpu':
-                for feature in sensor.get_features():
-                    # FIXED: Use sensor.get_all_subfeatures() instead of core.get_all_subfeatures()
-                    for subfeature in sensor.get_all_subfeatures(feature):
-                        # Only process temperature inputs (temp*_input), not voltage/fan/frequency readings
-                        if subfeature.name.startswith('temp') and subfeature.name.endswith("_input"):
-                            try:
-                                temp = sensor.get_value(subfeature.number)
-                                # Use the original range 0-125°C as specified in the plan
-                                # This handles edge cases and cold GPUs properly
-                                if 0 <= temp <= 125:  # Validate plausible range
-                                    amd_temps.append(temp)
-                                else:
-                                    print(f"Warning: Invalid AMD GPU temperature {temp}°C (ignored)", file=sys.stderr)
-                            except Exception as e:
-                                print(f"Warning: Error reading AMD GPU temperature: {str(e)}", file=sys.stderr)
+            if sensor.prefix not in ('coretemp', 'amdgpu'):
+                continue
+            subs = _coretemp_subs if sensor.prefix == 'coretemp' else _amdgpu_subs
+            for feature in sensor.get_features():
+                # Only process temperature inputs (temp*_input), not voltage/fan/power readings
+                if feature.type != sensors.FEATURE_TEMP:
+                    continue
+                subfeature = sensor.get_subfeature(feature, sensors.SUBFEATURE_TEMP_INPUT)
+                if subfeature is not None:
+                    subs.append((sensor, subfeature.number))
     except Exception as e:
-        print(f"Error in get_amd_temperatures(): {str(e)}", file=sys.stderr)
+        print(f"Error in init_sensors(): {str(e)}", file=sys.stderr)
+
+def cleanup_sensors():
+    """
+    Release libsensors resources. Safe to call more than once, as
+    graceful_shutdown() runs from both the signal handler and the
+    final cleanup of the main program.
+    """
+    global _sensors_inited
+    if _sensors_inited:
+        _sensors_inited = False
+        sensors.cleanup()
+
+def request_reload(signalnum=None, frame=None):
+    """
+    SIGHUP handler: only flags the reload, as the configuration and the
+    chips must not change while the main loop may still be using them,
+    and wakes the main loop up to do it right away.
+    """
+    global _reload_requested
+    _reload_requested = True
+    try:
+        os.write(_wakeup_write, b'\0')
+    except BlockingIOError:
+        pass  # Already woken up
+
+def rescan_sensors():
+    """
+    Rebuild the cached temperature inputs, e.g. after an amdgpu hwmon
+    device came back. libsensors itself is not initialized again: that
+    would free the chips in use if it failed, and sensors.init() only
+    loads the one file it is given, not /etc/sensors.d.
+    """
+    print("Rescanning temperature sensors.")
+    with _sensors_lock:
+        init_sensors()
+
+def get_cpu_temperature_summary():
+    """
+    Read the CPU core temperatures from the cached coretemp subfeatures and
+    return their rounded average and maximum, like summarize_temperatures().
+    Both are accumulated while reading, in a single pass and without an
+    intermediate list, which is quicker than gathering and then reducing.
+    """
+    total = count = 0
+    hottest = -1
+    for chip, number in _coretemp_subs:
+        temp = chip.get_value(number)
+        if 0 <= temp <= 125:  # Validate plausible range
+            total += temp
+            count += 1
+            if temp > hottest:
+                hottest = temp
+    if not count:
+        raise RuntimeError("No valid CPU temperature reading.")
+    return round(total / count), hottest
+
+def report_warnings(warnings):
+    """
+    Print the warnings gathered while reading a set of sensors with a single
+    write, rather than one (or two, with unbuffered output) per warning.
+    """
+    if warnings:
+        sys.stderr.write('\n'.join(warnings) + '\n')
+
+def get_amd_temperatures() -> list[int]:
+    """
+    Fetch AMD GPU temperatures straight from their hwmon sysfs files,
+    or using sensors library if none were found.
+    Returns a list of temperatures (or empty list if no AMD GPUs detected or errors occur).
+    Errors are printed to stderr.
+    """
+    if _amdgpu_subs is None:
+        init_sensors()
+    amd_temps = []
+    warnings = []
+    if _amdgpu_hwmon_paths:
+        for path in _amdgpu_hwmon_paths:
+            try:
+                with open(path, 'rb') as temp_file:
+                    temp = int(temp_file.read()) / 1000
+                if 0 <= temp <= 125:  # Validate plausible range
+                    amd_temps.append(temp)
+                else:
+                    warnings.append(f"Warning: Invalid AMD GPU temperature {temp}°C (ignored)")
+            except (OSError, ValueError) as e:
+                warnings.append(f"Warning: Error reading AMD GPU temperature: {str(e)}")
+        report_warnings(warnings)
+        return amd_temps
+
+    for sensor, number in _amdgpu_subs:
+        try:
+            temp = sensor.get_value(number)
+            # Use the original range 0-125°C as specified in the plan
+            # This handles edge cases and cold GPUs properly
+            if 0 <= temp <= 125:  # Validate plausible range
+                amd_temps.append(temp)
+            else:
+                warnings.append(f"Warning: Invalid AMD GPU temperature {temp}°C (ignored)")
+        except Exception as e:
+            warnings.append(f"Warning: Error reading AMD GPU temperature: {str(e)}")
     
+    report_warnings(warnings)
     return amd_temps
 
+def init_nvml():
+    """
+    Initialize NVML once and cache the handles of all NVIDIA GPUs.
+    If the NVIDIA driver is not available, the handles stay None and
+    the initialization is retried after NVML_RETRY_INTERVAL seconds.
+    """
+    global _nvml_handles, _nvml_retry_at
+    try:
+        pynvml.nvmlInit()
+    except pynvml.NVMLError as e:
+        print(f"Warning: NVML initialization failed: {str(e)}", file=sys.stderr)
+        _nvml_retry_at = time.monotonic() + NVML_RETRY_INTERVAL
+        return
+    try:
+        _nvml_handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(pynvml.nvmlDeviceGetCount())]
+    except pynvml.NVMLError as e:
+        print(f"Warning: Cannot enumerate NVIDIA GPUs: {str(e)}", file=sys.stderr)
+        pynvml.nvmlShutdown()
+        _nvml_retry_at = time.monotonic() + NVML_RETRY_INTERVAL
+
+def enable_nvidia_persistence_mode():
+    """
+    Enable NVIDIA persistence mode, so that the driver stays initialized
+    between temperature queries instead of being set up for each of them.
+    Failures (no nvidia-smi, no NVIDIA GPU, not root) are only reported.
+    """
+    cmd = ["nvidia-smi", "-pm", "1"]
+    if _DEBUG:
+        print(' '.join(cmd))
+        return
+    try:
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=5, check=True)
+    except FileNotFoundError:
+        print("Warning: nvidia-smi not found, cannot enable persistence mode.", file=sys.stderr)
+    except subprocess.TimeoutExpired:
+        print("Warning: nvidia-smi timed out while enabling persistence mode.", file=sys.stderr)
+    except subprocess.CalledProcessError as e:
+        print(f"Warning: Cannot enable NVIDIA persistence mode (exit={e.returncode}): {e.stderr.decode(errors='replace').strip()}", file=sys.stderr)
+
+def shutdown_nvml():
+    """
+    Release NVML if init_nvml() initialized it. Safe to call more than once.
+    """
+    global _nvml_handles
+    if _nvml_handles is not None:
+        _nvml_handles = None
+        try:
+            pynvml.nvmlShutdown()
+        except pynvml.NVMLError as e:
+            print(f"Warning: NVML shutdown failed: {str(e)}", file=sys.stderr)
+
 def get_nvidia_temperatures() -> list[int]:
     """
-    Fetch NVIDIA GPU temperatures using nvidia-smi with safety checks.
+    Fetch NVIDIA GPU temperatures using NVML with safety checks.
+    Falls back to nvidia-smi when the pynvml module is not installed.
     Returns a list of temperatures (or empty list if errors occur).
     Errors are printed to stderr.
     """
-    try:
-        # Run nvidia-smi with a 5-second timeout
-        result = subprocess.run(
-            ["nvidia-smi", "--query-gpu=temperature.gpu", "--format=csv,noheader,nounits"],
-            encoding="utf-8",
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            timeout=3,  # Prevent hanging
-            check=True,
-        )
-        
-        # Split and validate output
-        temps_raw = result.stdout.strip().split('\n')
+    if pynvml is not None:
+        if _nvml_handles is None:
+            if time.monotonic() < _nvml_retry_at:
+                return []
+            init_nvml()
+            if _nvml_handles is None:
+                return []
         temperatures = []
-        
-        for temp_str in temps_raw:
+        warnings = []
+        for handle in _nvml_handles:
             try:
-                temp = int(temp_str)
+                temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
                 if 0 <= temp <= 125:  # Validate plausible range
                     temperatures.append(temp)
                 else:
-                    print(f"Warning: Invalid NVIDIA GPU temperature '{temp_str}' (ignored)", file=sys.stderr)
-            except ValueError:
-                print(f"Warning: Non-numeric NVIDIA GPU temperature '{temp_str}' (ignored)", file=sys.stderr)
-        
+                    warnings.append(f"Warning: Invalid NVIDIA GPU temperature '{temp}' (ignored)")
+            except pynvml.NVMLError as e:
+                warnings.append(f"Warning: Error reading NVIDIA GPU temperature: {str(e)}")
+                if e.value in (pynvml.NVML_ERROR_GPU_IS_LOST, pynvml.NVML_ERROR_UNINITIALIZED):
+                    # Driver was reloaded or the GPU fell off the bus: the cached handles
+                    # are stale, start over with a fresh NVML session on the next poll
+                    shutdown_nvml()
+                    break
+        report_warnings(warnings)
         return temperatures
+
+    try:
+        return read_nvidia_smi_stream()
     except KeyboardInterrupt:
         raise  # Re-raise to allow main loop to handle
-    except subprocess.TimeoutExpired:
-        print("Error: nvidia-smi timed out (driver hung?).", file=sys.stderr)
-        return []
-    except subprocess.CalledProcessError as e:
-        print(f"Error: nvidia-smi failed (exit={e.returncode}): {e.stderr.strip()}", file=sys.stderr)
+    except FileNotFoundError:
+        print("Error: nvidia-smi not found.", file=sys.stderr)
+        defer_nvidia_smi_restart()
         return []
     except Exception as e:
         print(f"Error: Unexpected error in get_nvidia_temperatures(): {str(e)}", file=sys.stderr)
+        stop_nvidia_smi_stream()
+        defer_nvidia_smi_restart()
         return []
 
-def get_gpu_temperatures() -> list[int]:
+def start_nvidia_smi_stream():
+    """
+    Start nvidia-smi in loop mode, so that it reports the GPU temperatures
+    every polling interval without paying the process and driver startup
+    cost on each poll.
+    """
+    global _nvsmi_proc, _nvsmi_buffer, _nvsmi_temps, _nvsmi_last_sample
+    stop_nvidia_smi_stream()
+    # Report as often as the adaptive poll interval may poll
+    interval = config['general']['interval']
+    if config['general'].get('adaptive_interval'):
+        interval = min(config['general']['min_interval'], interval)
+    interval_ms = int(interval * 1000)
+    _nvsmi_proc = subprocess.Popen(
+        ["nvidia-smi", "--query-gpu=index,temperature.gpu", "--format=csv,noheader,nounits",
+         "-lms", str(interval_ms)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    os.set_blocking(_nvsmi_proc.stdout.fileno(), False)
+    _nvsmi_buffer = b''
+    _nvsmi_temps = {}
+    _nvsmi_last_sample = time.monotonic()
+
+def stop_nvidia_smi_stream():
+    """
+    Terminate the nvidia-smi loop mode process, if running.
+    """
+    global _nvsmi_proc
+    if _nvsmi_proc is None:
+        return
+    proc, _nvsmi_proc = _nvsmi_proc, None
+    try:
+        proc.kill()
+        proc.wait(timeout=3)
+    finally:
+        proc.stdout.close()
+
+def defer_nvidia_smi_restart():
+    """
+    Delay the next start of nvidia-smi after it failed, so that a missing
+    GPU or a broken driver does not cost a process spawn (and the wait
+    for its first sample) on every poll.
+    """
+    global _nvsmi_restart_delay, _nvsmi_restart_at
+    _nvsmi_restart_delay = min(max(2 * _nvsmi_restart_delay, config['general']['interval']),
+                               NVSMI_MAX_RESTART_DELAY)
+    _nvsmi_restart_at = time.monotonic() + _nvsmi_restart_delay
+
+def read_nvidia_smi_stream() -> list[int]:
+    """
+    Drain the samples written by the nvidia-smi loop mode process since
+    the last call and return the latest temperature of each GPU.
+    The process is (re)started when it is not running, and killed when
+    it stops reporting (driver hung?).
+    """
+    global _nvsmi_buffer, _nvsmi_temps, _nvsmi_last_sample, _nvsmi_restart_delay
+    if _nvsmi_proc is None:
+        if time.monotonic() < _nvsmi_restart_at:
+            return []
+        start_nvidia_smi_stream()
+    stdout = _nvsmi_proc.stdout
+    # Wait for the first sample after a (re)start, afterwards only read what is already there
+    if not select.select([stdout], [], [], 0 if _nvsmi_temps else 3)[0]:
+        if time.monotonic() - _nvsmi_last_sample > 2 * config['general']['interval'] + 3:
+            print("Error: nvidia-smi stopped reporting (driver hung?).", file=sys.stderr)
+            stop_nvidia_smi_stream()
+            defer_nvidia_smi_restart()
+            return []
+        return [_nvsmi_temps[i] for i in sorted(_nvsmi_temps)]
+
+    while True:
+        try:
+            chunk = os.read(stdout.fileno(), 65536)
+        except BlockingIOError:
+            break
+        if not chunk:
+            print(f"Error: nvidia-smi exited (exit={_nvsmi_proc.wait()}).", file=sys.stderr)
+            stop_nvidia_smi_stream()
+            defer_nvidia_smi_restart()
+            return []
+        _nvsmi_buffer += chunk
+
+    samples, _, _nvsmi_buffer = _nvsmi_buffer.rpartition(b'\n')
+    if samples:
+        # Keep the latest sample of each GPU, non-numeric values ('[N/A]', ...) become -1
+        latest = {int(index): int(temp) if temp.isdigit() else -1
+                  for index, temp in _NVSMI_SAMPLE_RE.findall(samples)}
+        # Validate plausible range, forgetting the previous reading of GPUs without a valid one
+        _nvsmi_temps = {index: temp for index, temp in {**_nvsmi_temps, **latest}.items() if 0 <= temp <= 125}
+        _nvsmi_last_sample = time.monotonic()
+        _nvsmi_restart_delay = 0.0
+        if _DEBUG and len(_nvsmi_temps) < len(latest):
+            print(f"Warning: Invalid NVIDIA GPU temperatures in '{samples.decode('utf-8', 'replace')}' (ignored)", file=sys.stderr)
+
+    return [_nvsmi_temps[i] for i in sorted(_nvsmi_temps)]
+
+@dataclasses.dataclass
+class GpuTemps:
+    """
+    Combined GPU temperatures, as returned by get_gpu_temperatures().
+    """
+    values: list         # Temperatures of all GPUs, [0] when none could be read
+    all_zero: bool       # Every value is 0°C (no GPU readings, or a driver problem)
+    source: str          # Which GPUs reported: 'amd', 'nvidia', 'amd+nvidia', 'none', 'error' or 'stale'
+
+def get_gpu_temperatures() -> GpuTemps:
     """
     Get temperatures from all available GPUs (both AMD and NVIDIA).
-    Returns combined list of all GPU temperatures.
+    Returns combined list of all GPU temperatures, flagging whether
+    they are all 0°C along the way.
     
     Improved version with proper error handling and validation.
     """
     temperatures = []
+    sources = []
     
     try:
         # Get AMD GPU temperatures using sensors library
@@ -100,10 +425,11 @@ def get_gpu_temperatures() -> list[int]:
             amd_temps = get_amd_temperatures()
             if amd_temps:
                 temperatures.extend(amd_temps)
-                if config['general']['debug']:
+                sources.append('amd')
+                if _DEBUG:
                     print(f"AMD GPU temperatures detected: {amd_temps}")
             else:
-                if config['general']['debug']:
+                if _DEBUG:
                     print("Warning: No AMD GPU temperatures detected", file=sys.stderr)
         
         # Get NVIDIA GPU temperatures using nvidia-smi
@@ -111,20 +437,72 @@ def get_gpu_temperatures() -> list[int]:
             nvidia_temps = get_nvidia_temperatures()
             if nvidia_temps:
                 temperatures.extend(nvidia_temps)
-                if config['general']['debug']:
+                sources.append('nvidia')
+                if _DEBUG:
                     print(f"NVIDIA GPU temperatures detected: {nvidia_temps}")
             else:
-                if config['general']['debug']:
+                if _DEBUG:
                     print("Warning: No NVIDIA GPU temperatures detected", file=sys.stderr)
     except KeyboardInterrupt:
         raise  # Re-raise to allow main loop to handle
     except Exception as e:
         print(f"Error in get_gpu_temperatures(): {str(e)}", file=sys.stderr)
-        return [0]
+        return GpuTemps([0], True, 'error')
     
     # Return combined temperatures or fallback
-    return temperatures if temperatures else [0]
-        
+    if not temperatures:
+        return GpuTemps([0], True, 'none')
+    return GpuTemps(temperatures, not any(temperatures), '+'.join(sources))
+
+# Latest reading of the background GPU poller, with its time.monotonic() timestamp
+_gpu_cond = threading.Condition()
+_gpu_latest = None
+_gpu_latest_at = 0.0
+_gpu_poll_requested = threading.Event()
+# Held while the chips are read by the poller, or reloaded with the configuration
+_sensors_lock = threading.Lock()
+# graceful_shutdown() takes _sensors_lock for good, waiting at most SHUTDOWN_LOCK_TIMEOUT seconds for the poller
+SHUTDOWN_LOCK_TIMEOUT = 5
+_shutdown_lock_held = False
+# How long the first tick waits for the first GPU reading
+GPU_FIRST_POLL_TIMEOUT = 10
+
+def gpu_poller():
+    """
+    Body of the background GPU polling thread: poll the GPUs each time
+    request_gpu_poll() is called and publish the reading, so that the
+    control loop never waits on nvidia-smi or the GPU drivers.
+    """
+    global _gpu_latest, _gpu_latest_at
+    while True:
+        _gpu_poll_requested.wait()
+        _gpu_poll_requested.clear()
+        with _sensors_lock:
+            gpu = get_gpu_temperatures()
+        with _gpu_cond:
+            _gpu_latest, _gpu_latest_at = gpu, time.monotonic()
+            _gpu_cond.notify_all()
+
+def request_gpu_poll():
+    """
+    Ask the background poller for a new GPU reading.
+    """
+    _gpu_poll_requested.set()
+
+def latest_gpu_temperatures(max_age) -> GpuTemps:
+    """
+    Return the latest reading of the background poller, waiting for
+    the very first one. Readings older than max_age seconds (poller
+    stuck in a driver call) are replaced by the [0] fallback.
+    """
+    with _gpu_cond:
+        if _gpu_latest is None:
+            _gpu_cond.wait_for(lambda: _gpu_latest is not None, timeout=GPU_FIRST_POLL_TIMEOUT)
+        if _gpu_latest is None or time.monotonic() - _gpu_latest_at > max_age:
+            print("Error: GPU temperature polling timed out.", file=sys.stderr)
+            return GpuTemps([0], True, 'stale')
+        return _gpu_latest
+
 
 config = {
     'config_paths': ['fan_control.yaml', '/opt/fan_control/fan_control.yaml'],
@@ -134,34 +512,198 @@ config = {
     },
     'host': {}
 }
+# General settings given on the command line, which take precedence over the config file
+cli_general = {}
 state = {}
 
+# Number of (time, effective temperature) samples the adaptive poll interval looks at
+TEMP_HISTORY_SIZE = 4
+# How much the adaptive poll interval shrinks per °C/s of effective temperature change
+ADAPTIVE_INTERVAL_GAIN = 2
+# Whether a tick longer than the poll interval was already reported
+_tick_overrun_reported = False
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class HostCfg:
+    """
+    Host thresholds and speeds, frozen from config['host'].
+    """
+    temperatures: tuple
+    speeds: tuple
+    hysteresis: int
+    # Temperature each threshold must fall to before a lower speed is picked
+    # while running faster (or in automatic mode), with the hysteresis folded in
+    release_temps: tuple
+
+    @classmethod
+    def from_config(cls, host):
+        if host['hysteresis']:
+            release_temps = tuple(temp - host['hysteresis'] for temp in host['temperatures'])
+        else:
+            release_temps = (float('inf'),) * len(host['temperatures'])
+        return cls(tuple(host['temperatures']), tuple(host['speeds']), host['hysteresis'], release_temps)
+
+# Configuration values used on every tick, cached by refresh_config_cache()
+_DEBUG = False
+HOST = HostCfg((), (), 0, ())
+# Sorted thresholds of the CPU (False) and GPU (True) curves
+_curve_temps = {}
+# Sorted thresholds and release temperatures of each curve: the temperatures
+# between two consecutive bounds all lead compute_fan_speed() to the same decision
+_curve_bounds = {}
+
 
 class ConfigError(Exception):
     pass
 
+# IPMI hex notation of every byte value, indexed by the value
+_HEX_BYTE = tuple(f"0x{n:02x}" for n in range(256))
+
+# Attempts at setting the fan speed, and the delay between them (seconds)
+SET_FAN_SPEED_ATTEMPTS = 4
+SET_FAN_SPEED_RETRY_DELAY = 0.1
+
+# Long-running 'ipmitool shell' process, started by start_ipmitool_shell()
+_ipmi_shell = None
+IPMITOOL_PROMPT = b'ipmitool> '
+# Output of a successful raw command: at most the response bytes, in hex
+_IPMI_RAW_OK_RE = re.compile(rb'[\s0-9a-fA-F]*')
+
+def loggable_command(cmd):
+    """
+    Return the command line as a shell-quoted string, with the values
+    of the IPMI credential options (-U user, -P password) masked.
+    """
+    safe = []
+    args = iter(cmd)
+    for arg in args:
+        safe.append(arg)
+        if arg in ('-U', '-P') and next(args, None) is not None:
+            safe.append('___')
+    return shlex.join(safe)
+
+def start_ipmitool_shell():
+    """
+    Start 'ipmitool shell', so that the following commands are run without
+    spawning ipmitool and opening a BMC session for each of them. If the
+    shell does not come up, ipmitool keeps being run once per command.
+    """
+    global _ipmi_shell
+    try:
+        _ipmi_shell = subprocess.Popen(
+            ["ipmitool", "shell"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,  # Keep terminal SIGINT away from it
+        )
+    except OSError as e:
+        print(f"Warning: Cannot start ipmitool shell: {str(e)}", file=sys.stderr)
+        return
+    os.set_blocking(_ipmi_shell.stdout.fileno(), False)
+    if read_ipmitool_shell(5) is None:
+        print("Warning: ipmitool shell is not available, running ipmitool for each command.", file=sys.stderr)
+        stop_ipmitool_shell()
+
+def stop_ipmitool_shell():
+    """
+    Exit the ipmitool shell, if running.
+    """
+    global _ipmi_shell
+    if _ipmi_shell is None:
+        return
+    proc, _ipmi_shell = _ipmi_shell, None
+    try:
+        proc.stdin.write(b'exit\n')
+        proc.stdin.close()
+        proc.wait(timeout=3)
+    except (OSError, subprocess.TimeoutExpired):
+        proc.kill()
+        proc.wait()
+    finally:
+        proc.stdout.close()
+
+def read_ipmitool_shell(timeout):
+    """
+    Read the ipmitool shell output up to its next prompt.
+    Returns None if the prompt did not come within timeout seconds.
+    """
+    stdout = _ipmi_shell.stdout
+    output = b''
+    deadline = time.monotonic() + timeout
+    while not output.endswith(IPMITOOL_PROMPT):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not select.select([stdout], [], [], remaining)[0]:
+            return None
+        try:
+            chunk = os.read(stdout.fileno(), 4096)
+        except BlockingIOError:
+            continue
+        if not chunk:
+            return None  # ipmitool exited
+        output += chunk
+    return output[:-len(IPMITOOL_PROMPT)]
+
+def ipmitool_shell_command(args):
+    """
+    Run a raw command in the ipmitool shell. As the shell has no exit
+    status, any output but the hex response bytes is taken as a failure.
+    The shell is dropped, for one ipmitool process per command, if it
+    stops answering; None is then returned for the caller to run the
+    command again on its own.
+    """
+    try:
+        _ipmi_shell.stdin.write(args.encode() + b'\n')
+        _ipmi_shell.stdin.flush()
+        output = read_ipmitool_shell(15)
+    except OSError:
+        output = None
+    if output is None:
+        print(f"\"{args}\" command got no answer from ipmitool shell, running ipmitool for each command.", file=sys.stderr)
+        stop_ipmitool_shell()
+        return None
+    # Without a terminal, the shell may echo the command before its output
+    output = b'\n'.join(line for line in output.splitlines() if line.strip() != args.encode())
+    if not _IPMI_RAW_OK_RE.fullmatch(output):
+        print(f"\"{args}\" command has failed: {output.decode(errors='replace').strip()}", file=sys.stderr)
+        return False
+    return True
+
 def ipmitool(args):
-    global state
-    host = config['host']
     cmd = ["ipmitool"]
     cmd += (args.split(' '))
-    if config['general']['debug']:
-        print(re.sub(r'-([UP]) (\S+)', r'-\1 ___', ' '.join(cmd)))  # Do not log IPMI credentials
+    if _DEBUG:
+        print(loggable_command(cmd))  # Do not log IPMI credentials
         return True
+    if _ipmi_shell is not None:
+        result = ipmitool_shell_command(args)
+        if result is not None:
+            return result
     try:
         subprocess.check_output(cmd, timeout=15)
     except subprocess.CalledProcessError:
-        print("\"{}\" command has returned a non-0 exit code".format(cmd), file=sys.stderr)
+        print("\"{}\" command has returned a non-0 exit code".format(loggable_command(cmd)), file=sys.stderr)
         return False
     except subprocess.TimeoutExpired:
-        print("\"{}\" command has timed out".format(cmd), file=sys.stderr)
+        print("\"{}\" command has timed out".format(loggable_command(cmd)), file=sys.stderr)
         return False
     return True
 
+def ipmitool_batch(commands):
+    """
+    Run several ipmitool commands with a single ipmitool process,
+    through its 'exec' subcommand, sparing one process spawn and
+    BMC session setup per additional command. The ipmitool shell, when
+    running, already spares them.
+    """
+    if _DEBUG or _ipmi_shell is not None:
+        return all([ipmitool(command) for command in commands])
+    with tempfile.NamedTemporaryFile('w', prefix='fan_control_', suffix='.ipmi') as commands_file:
+        commands_file.write('\n'.join(commands) + '\n')
+        commands_file.flush()
+        return ipmitool(f"exec {commands_file.name}")
 
 def set_fan_control(wanted_mode):
-    global state
-    host = config['host']
     if wanted_mode == "manual" and state['fan_control_mode'] == "automatic":
         ipmitool("raw 0x30 0x30 0x01 0x00")
     elif wanted_mode == "automatic" and state['fan_control_mode'] == "manual":
@@ -170,22 +712,34 @@ def set_fan_control(wanted_mode):
     state['fan_control_mode'] = wanted_mode
 
 def set_fan_speed(threshold_n):
-    global state
-    host = config['host']
-    wanted_percentage = host['speeds'][threshold_n]
-    if config['general']['debug']:
+    wanted_percentage = HOST.speeds[threshold_n]
+    if _DEBUG:
         print(f"\tWanted percentage: {wanted_percentage}%")
     if wanted_percentage == state['fan_speed']:
         return
     if 5 <= wanted_percentage <= 100:
-        wanted_percentage_hex = "{0:#0{1}x}".format(wanted_percentage, 4)
+        speed_command = f"raw 0x30 0x30 0x02 0xff {_HEX_BYTE[wanted_percentage]}"
+        if not _DEBUG:
+            print("[{}] Setting fans speed to {}%".format(config['host']['name'], wanted_percentage))
         if state['fan_control_mode'] != "manual":
+            # Switch to manual mode and set the speed with a single ipmitool process,
+            # falling back to separate commands if that fails
+            if ipmitool_batch(["raw 0x30 0x30 0x01 0x00", speed_command]):
+                state['fan_control_mode'] = "manual"
+                state['fan_speed'] = wanted_percentage
+                return
             set_fan_control("manual")
-            time.sleep(1)
-        if not config['general']['debug']:
-            print("[{}] Setting fans speed to {}%".format(host['name'], wanted_percentage))
-        ipmitool(f"raw 0x30 0x30 0x02 0xff {wanted_percentage_hex}")
-        state['fan_speed'] = wanted_percentage
+        # The BMC usually accepts the speed right after the switch to manual mode:
+        # only wait and retry if it is rejected, instead of always sleeping a second
+        for attempt in range(SET_FAN_SPEED_ATTEMPTS):
+            if attempt:
+                time.sleep(SET_FAN_SPEED_RETRY_DELAY)
+            if ipmitool(speed_command):
+                state['fan_speed'] = wanted_percentage
+                return
+        # Keep the previous speed, so that the next tick tries again
+        print(f"Error: Cannot set fans speed to {wanted_percentage}%.", file=sys.stderr)
+        state.pop('last_decision', None)
 
 def validate_temperature_curve(curve_name, temperatures, speeds):
     """
@@ -235,13 +789,34 @@ def validate_temperature_curve(curve_name, temperatures, speeds):
 
 
 def parse_config():
-    global config, state
-    config_path = next((p for p in config['config_paths'] if os.path.isfile(p)), None)
-    if not config_path:
+    # Open the first existing candidate directly, rather than checking for it first,
+    # and let libyaml decode the raw bytes itself
+    for config_path in config['config_paths']:
+        try:
+            with open(config_path, 'rb') as yaml_conf:
+                config.update(yaml.load(yaml_conf, Loader=SafeLoader))
+            break
+        except (FileNotFoundError, IsADirectoryError):
+            continue
+    else:
         raise RuntimeError("Missing or unspecified configuration file.")
-    with open(config_path, 'r') as yaml_conf:
-        config.update(yaml.safe_load(yaml_conf))
     
+    # General settings defaults
+    general = config['general']
+    general.update(cli_general)
+    if 'debug' not in general:
+        general['debug'] = False
+    if 'interval' not in general:
+        general['interval'] = 60
+    if 'adaptive_interval' not in general:
+        general['adaptive_interval'] = False  # Opt-in, keeps the polling cadence of existing configs
+    if 'min_interval' not in general:
+        general['min_interval'] = 5
+    for key in ('interval', 'min_interval'):
+        if isinstance(general[key], bool) or not isinstance(general[key], (int, float)) or not 0 < general[key] < float('inf'):
+            raise ConfigError(f'General setting "{key}" is {general[key]!r} - must be a positive number of seconds.')
+        general[key] = float(general[key])
+
     # Validate GPU monitoring configuration
     if 'gpu_monitoring' not in config:
         config['gpu_monitoring'] = {}
@@ -316,20 +891,80 @@ def parse_config():
     if 'hysteresis' not in host:
         host['hysteresis'] = 2
 
+    refresh_config_cache()
+
     # Initialize state
     state.update({
         'fan_control_mode': 'automatic',
-        'fan_speed': 0
+        'fan_speed': 0,
+        'selected_speed': None,
+        'stable_ticks': 0,
+        'gpu_temps': None,
+        'effective_temp': None,
+        'use_gpu_curve': False,
+        'temp_history': collections.deque(maxlen=TEMP_HISTORY_SIZE)
     })
-    if config['general']['debug']:
+    if _DEBUG:
         print("\nInitial state:")
         print(state)
         print("\nInitial config:")
         print(config)
         print('')
 
+def refresh_config_cache():
+    """
+    Copy the configuration values read on every tick into module globals,
+    sparing the control loop the nested config dict lookups.
+    Must be called again whenever config is modified.
+    """
+    global _DEBUG, HOST
+    host = config['host']
+    _DEBUG = config['general']['debug']
+    HOST = HostCfg.from_config(host)
+    # Thresholds of both curves for compute_fan_speed(), keyed by use_gpu_curve
+    cpu_curve = config.get('temperature_control', {}).get('cpu_curve', host)
+    gpu_curve = config.get('temperature_control', {}).get('gpu_curve', cpu_curve)
+    _curve_temps[False] = tuple(cpu_curve['temperatures'])
+    _curve_temps[True] = tuple(gpu_curve['temperatures'])
+    for use_gpu_curve, temps in _curve_temps.items():
+        _curve_bounds[use_gpu_curve] = tuple(sorted({*temps, *HOST.release_temps}))
+    # Decisions taken with the previous values are no longer valid
+    state.pop('last_decision', None)
+
+def reload_config():
+    """
+    Parse the configuration file again and rebuild the sensor caches,
+    without the restart that would set up libsensors, NVML and ipmitool
+    from scratch. The fan state and the last GPU readings are kept, and
+    an invalid configuration file leaves the running configuration in place.
+    The nvidia-smi stream is restarted if its reporting interval changed.
+    """
+    global _reload_requested
+    _reload_requested = False
+    print("Reloading configuration.")
+    sd_notify(f"RELOADING=1\nMONOTONIC_USEC={time.clock_gettime_ns(time.CLOCK_MONOTONIC) // 1000}")
+    previous_config = copy.deepcopy(config)
+    fan_state = {key: state[key] for key in ('fan_control_mode', 'fan_speed', 'gpu_temps')}
+    with _sensors_lock:
+        # Start over from an empty configuration, so that removed settings get their defaults back
+        config.clear()
+        config.update({'config_paths': previous_config['config_paths'], 'general': {}, 'host': {}})
+        try:
+            parse_config()
+        except Exception as e:
+            print(f"Error: Cannot reload configuration, keeping the current one: {str(e)}", file=sys.stderr)
+            config.clear()
+            config.update(previous_config)
+            refresh_config_cache()
+        state.update(fan_state)
+        if any(config['general'].get(key) != previous_config['general'].get(key)
+               for key in ('interval', 'adaptive_interval', 'min_interval')):
+            # Started again at the new interval by the next read_nvidia_smi_stream()
+            stop_nvidia_smi_stream()
+    rescan_sensors()
+    sd_notify(ready_notification())
+
 def parse_opts():
-    global config
     help_str = "fan_control.py [-d] [-c <path_to_config>] [-i <interval>]"
 
     try:
@@ -343,21 +978,26 @@ def parse_opts():
             print(help_str)
             raise InterruptedError
         elif opt in ('-d', '--debug'):
-            config['general']['debug'] = True
+            cli_general['debug'] = True
         elif opt in ('-c', '--config'):
             config['config_paths'] = [arg]
         elif opt in ('-i', '--interval'):
-            config['general']['interval'] = arg
+            try:
+                interval = float(arg)
+            except ValueError:
+                interval = 0
+            if not 0 < interval < float('inf'):
+                print("Invalid interval '{}', must be a positive number of seconds. Usage:\n{}".format(arg, help_str))
+                raise getopt.GetoptError(f"invalid interval '{arg}'")
+            cli_general['interval'] = interval
 
-def checkHysteresis(temperature, threshold_n):
-    global state
-    host = config['host']
-    if not host['hysteresis']:
-        return True
-    if (state['fan_speed'] > host['speeds'][threshold_n] or
-        state['fan_control_mode'] == 'automatic'):
-        return temperature <= host['temperatures'][threshold_n] - host['hysteresis']
-    return True
+def summarize_temperatures(temps):
+    """
+    Return the rounded average and the maximum of a non-empty list of temperatures.
+    """
+    # sum() and max() each walk the list in C: for an existing list of a few dozen
+    # readings this is faster than a single-pass Python loop computing both at once
+    return round(sum(temps) / len(temps)), max(temps)
 
 def calculate_effective_temperature(cpu_temp_avg, cpu_temp_max, gpu_temps):
     """
@@ -379,8 +1019,7 @@ def calculate_effective_temperature(cpu_temp_avg, cpu_temp_max, gpu_temps):
     hotspot_threshold = temp_control.get('hotspot_threshold', 10)  # Default 10°C difference
     
     # Handle GPU temperatures
-    gpu_temp_avg = round(sum(gpu_temps)/len(gpu_temps)) if gpu_temps else 0
-    gpu_temp_max = max(gpu_temps) if gpu_temps else 0
+    gpu_temp_avg, gpu_temp_max = summarize_temperatures(gpu_temps) if gpu_temps else (0, 0)
     
     # Check for CPU hotspot condition
     cpu_hotspot_detected = (cpu_temp_max - cpu_temp_avg) >= hotspot_threshold
@@ -420,42 +1059,106 @@ def calculate_effective_temperature(cpu_temp_avg, cpu_temp_max, gpu_temps):
     
     return effective_temp, use_gpu_curve, debug_info
 
+def pick_band(temp, temps, release_temps, speeds, fan_speed, manual):
+    """
+    Threshold lookup of compute_fan_speed(), on plain numbers and tuples
+    and without side effects. Returns the index of the threshold whose
+    speed to apply, len(temps) to leave the fans as they are, or -1 for
+    automatic mode (temperature above the highest threshold).
+    """
+    # Find the appropriate speed level with hysteresis, starting from the
+    # first threshold not below the temperature (thresholds are sorted).
+    # Hysteresis applies when coming from a higher speed or automatic mode.
+    first = bisect.bisect_left(temps, temp)
+    if first == len(temps):
+        return -1
+    for i in range(first, len(temps)):
+        if (manual and fan_speed <= speeds[i]) or temp <= release_temps[i]:
+            return i
+    return len(temps)
+
 def compute_fan_speed(temp_average, use_gpu_curve=False):
     """
     Compute fan speed using appropriate curve (CPU or GPU).
     Configuration is already validated during startup, so we can assume valid data.
     """
-    global state
+    
+    # The decision only depends on where the temperature lies between the
+    # thresholds and release temperatures, and on the fan state: skip it
+    # while none of them changed since the previous tick
+    decision_key = (bisect.bisect_left(_curve_bounds[use_gpu_curve], temp_average), use_gpu_curve,
+                    state['fan_speed'], state['fan_control_mode'])
+    if decision_key == state.get('last_decision'):
+        return
+    state['last_decision'] = decision_key
     
     # Determine which curve to use - configuration already validated during startup
-    if use_gpu_curve:
-        curve = config['temperature_control']['gpu_curve']
-    else:
-        curve = config['temperature_control']['cpu_curve']
+    temps = _curve_temps[use_gpu_curve]
+    band = pick_band(temp_average, temps, HOST.release_temps, HOST.speeds,
+                     state['fan_speed'], state['fan_control_mode'] != 'automatic')
     
-    temps = curve['temperatures']
-    speeds = curve['speeds']
-    hysteresis = curve.get('hysteresis', config['host'].get('hysteresis', 2))
+    # Any change of decision restarts the stability count used to skip GPU polls
+    selected_speed = band if band >= 0 else len(temps)
+    if (selected_speed, use_gpu_curve) != state.get('selected_speed'):
+        state['selected_speed'] = (selected_speed, use_gpu_curve)
+        state['stable_ticks'] = 0
     
     # Handle automatic mode if above highest threshold
-    if temp_average > temps[-1]:
+    if band < 0:
         set_fan_control("automatic")
-        return
-    
-    # Find the appropriate speed level with hysteresis
-    selected_speed = len(temps)  # Default to automatic (will be reduced in loop)
-    for i, threshold in enumerate(temps):
-        if temp_average <= threshold and checkHysteresis(temp_average, i):
-            selected_speed = i
-            break
-    
     # Apply the speed if found (and not automatic)
-    if selected_speed < len(speeds):
-        set_fan_speed(selected_speed)
+    elif band < len(temps):
+        set_fan_speed(band)
+
+def skip_gpu_polling():
+    """
+    Tell whether the current GPU temperatures can be reused for the next tick.
+    This is the case every other tick once the selected speed has been
+    stable for a few ticks and the last effective temperature was far
+    (more than 3 times the hysteresis) from every threshold of its curve,
+    so GPU readings are at most two intervals old.
+    """
+    if state.get('gpu_temps') is None or state.get('effective_temp') is None:
+        return False
+    if state['stable_ticks'] <= 3 or state['stable_ticks'] % 2 == 0:
+        return False
+    curve = config['temperature_control']['gpu_curve' if state['use_gpu_curve'] else 'cpu_curve']
+    hysteresis = curve.get('hysteresis', config['host'].get('hysteresis', 2))
+    distance = min(abs(state['effective_temp'] - t) for t in curve['temperatures'])
+    return distance > hysteresis * 3
+
+# Worst case duration of a tick, on top of the polling interval, for the systemd watchdog
+WATCHDOG_MARGIN = 120
+
+def sd_notify(message):
+    """
+    Send a state notification to systemd through the sd_notify protocol,
+    when it runs this script as a Type=notify service. Does nothing otherwise.
+    """
+    address = os.environ.get('NOTIFY_SOCKET')
+    if not address:
+        return
+    if address.startswith('@'):
+        address = '\0' + address[1:]  # Abstract namespace socket
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM | socket.SOCK_CLOEXEC) as notify_socket:
+            notify_socket.connect(address)
+            notify_socket.sendall(message.encode())
+    except OSError as e:
+        print(f"Warning: Cannot notify systemd: {str(e)}", file=sys.stderr)
+
+def ready_notification():
+    """
+    Return the sd_notify message telling systemd the service is ready. When
+    the watchdog is enabled, its timeout is adjusted to the polling interval,
+    as a WATCHDOG=1 ping is only sent once per tick.
+    """
+    if 'WATCHDOG_USEC' not in os.environ:
+        return "READY=1"
+    watchdog_usec = int((2 * config['general']['interval'] + WATCHDOG_MARGIN) * 1000000)
+    return f"READY=1\nWATCHDOG_USEC={watchdog_usec}"
 
 def main():
-    global config
-    global state
 
     print("Starting fan control script.")
     host = config['host']
@@ -491,35 +1194,97 @@ def main():
                 for temp, speed in zip(host['temperatures'], host['speeds'])
             )
         ))
+    # The GPUs are polled by a background thread during the sleep between ticks
+    threading.Thread(target=gpu_poller, name='gpu_poll', daemon=True).start()
+    request_gpu_poll()
+    gpu_polled = True
+    sd_notify(ready_notification())
+    deadline = time.monotonic()
     while True:
-        temps = []
-        cores = []
-        for sensor in sensors.get_detected_chips():
-            if sensor.prefix == "coretemp":
-                cores.append(sensor)
-        for core in cores:
-            for feature in core.get_features():
-                for subfeature in core.get_all_subfeatures(feature):
-                    if subfeature.name.endswith("_input"):
-                        temps.append(core.get_value(subfeature.number))
-        cpu_temp_avg = round(sum(temps)/len(temps))
-        cpu_temp_max = max(temps) if temps else cpu_temp_avg
-        gpu_temps = get_gpu_temperatures()
-        if all(temp == 0 for temp in gpu_temps):
-            print("Warning: All GPU temps reported as 0°C (check driver).", file=sys.stderr)
+        if _reload_requested:
+            reload_config()
+            host = config['host']
+        cpu_temp_avg, cpu_temp_max = get_cpu_temperature_summary()
+        if gpu_polled:
+            gpu = latest_gpu_temperatures(2 * config['general']['interval'])
+            gpu_temps = gpu.values
+            if gpu.all_zero:
+                print("Warning: All GPU temps reported as 0°C (check driver).", file=sys.stderr)
+        else:
+            gpu_temps = state['gpu_temps']
+            if _DEBUG:
+                print(f"[{host['name']}] Far from thresholds, reusing GPU temperatures: {gpu_temps}")
         
         # Use improved algorithm with hotspot protection
         effective_temp, use_gpu_curve, debug_info = calculate_effective_temperature(cpu_temp_avg, cpu_temp_max, gpu_temps)
         
-        if config['general']['debug']:
+        if _DEBUG:
             print(f"[{host['name']}] CPU_Avg: {debug_info['cpu_avg']} CPU_Max: {debug_info['cpu_max']} GPU_M: {debug_info['gpu_max']} GPU_A: {debug_info['gpu_avg']}")
             print(f"[{host['name']}] Decision: {debug_info['decision']} -> Effective: {effective_temp}°C, Curve: {'GPU' if use_gpu_curve else 'CPU'}")
             if debug_info.get('cpu_hotspot'):
                 print(f"[{host['name']}] HOTSPOT DETECTED: CPU max {debug_info['cpu_max']}°C vs avg {debug_info['cpu_avg']}°C")
         
         compute_fan_speed(effective_temp, use_gpu_curve)
-        time.sleep(config['general']['interval'])
+        state.update({
+            'gpu_temps': gpu_temps,
+            'effective_temp': effective_temp,
+            'use_gpu_curve': use_gpu_curve,
+            'stable_ticks': state['stable_ticks'] + 1
+        })
+        gpu_polled = not skip_gpu_polling()
+        if gpu_polled:
+            request_gpu_poll()
+        poll_interval = next_poll_interval(effective_temp)
+        if _DEBUG:
+            print(f"[{host['name']}] Next poll in {poll_interval:.1f}s")
+        # A tick got through: keep the systemd watchdog from restarting a hung service
+        sd_notify("WATCHDOG=1")
+        deadline = wait_next_tick(deadline, poll_interval)
+
+
+def wait_next_tick(deadline, poll_interval):
+    """
+    Sleep until poll_interval seconds after the deadline of the current
+    tick, so that the time spent in the ticks (IPMI commands, sensors)
+    does not add up over time. If the tick overran that, the missed
+    ticks are skipped rather than run back to back. A reload request
+    ends the wait early.
+    Returns the deadline of the next tick.
+    """
+    global _tick_overrun_reported
+    deadline += poll_interval
+    now = time.monotonic()
+    if deadline < now:
+        if not _tick_overrun_reported:
+            print(f"Warning: Polling tick took {now - deadline + poll_interval:.1f}s, longer than the {poll_interval:.1f}s interval (reported once).", file=sys.stderr)
+            _tick_overrun_reported = True
+        deadline += poll_interval * math.ceil((now - deadline) / poll_interval)
+    if select.select([_wakeup_read], [], [], deadline - now)[0]:
+        try:
+            while os.read(_wakeup_read, 4096):
+                pass
+        except BlockingIOError:
+            pass
+    return deadline
 
+def next_poll_interval(effective_temp):
+    """
+    Record the effective temperature and return the time between this
+    tick and the next one. With adaptive_interval enabled, the configured interval
+    is divided by (1 + slope * ADAPTIVE_INTERVAL_GAIN), using the steepest
+    slope (°C/s) between the recent samples, down to min_interval. Quick
+    temperature changes are thus followed closely, while a steady
+    temperature is polled at the configured interval.
+    """
+    general = config['general']
+    interval = general['interval']
+    history = state['temp_history']
+    history.append((time.monotonic(), effective_temp))
+    if not general['adaptive_interval'] or len(history) < 2:
+        return interval
+    slope = max(abs(temp - prev_temp) / max(now - prev_now, 1e-3)
+                for (prev_now, prev_temp), (now, temp) in itertools.pairwise(history))
+    return max(min(general['min_interval'], interval), interval / (1 + slope * ADAPTIVE_INTERVAL_GAIN))
 
 def graceful_shutdown(signalnum=None, frame=None):
     """
@@ -527,18 +1292,44 @@ def graceful_shutdown(signalnum=None, frame=None):
     sensors are cleaned up, and the script exits cleanly.
     This function swallows any errors to guarantee shutdown.
     """
+    global _shutdown_lock_held
     print(f"Signal {signalnum} received, performing shutdown procedure.")
+    sd_notify("STOPPING=1")
+    # Attempt ipmitool shell exit, ignoring failures. The shell may have
+    # been killed along with us, so the last command is run on its own.
+    try:
+        stop_ipmitool_shell()
+    except Exception as e:
+        print(f"Error during stop_ipmitool_shell in shutdown: {e}", file=sys.stderr)
     # Attempt to set fans to automatic, ignoring failures
     try:
         if state.get('fan_control_mode') is not None:
             set_fan_control("automatic")
     except Exception as e:
         print(f"Error during set_fan_control in shutdown: {e}", file=sys.stderr)
+    # Keep the GPU poller out of libsensors and NVML while they are released.
+    # The lock is not given back, as the poller must not use them afterwards.
+    if not _shutdown_lock_held:
+        _shutdown_lock_held = _sensors_lock.acquire(timeout=SHUTDOWN_LOCK_TIMEOUT)
+        if not _shutdown_lock_held:
+            print("Warning: GPU polling still running, leaving libsensors and NVML to the process exit.", file=sys.stderr)
     # Attempt sensors cleanup, ignoring failures
     try:
-        sensors.cleanup()
+        if _shutdown_lock_held:
+            cleanup_sensors()
     except Exception as e:
         print(f"Error during sensors.cleanup in shutdown: {e}", file=sys.stderr)
+    # Attempt nvidia-smi loop mode process termination, ignoring failures
+    try:
+        stop_nvidia_smi_stream()
+    except Exception as e:
+        print(f"Error during stop_nvidia_smi_stream in shutdown: {e}", file=sys.stderr)
+    # Attempt NVML shutdown, ignoring failures
+    try:
+        if _shutdown_lock_held:
+            shutdown_nvml()
+    except Exception as e:
+        print(f"Error during nvmlShutdown in shutdown: {e}", file=sys.stderr)
     # Exit regardless
     sys.exit(0)
 
@@ -546,10 +1337,19 @@ if __name__ == "__main__":
     # Register OS signals to ensure graceful shutdown
     signal.signal(signal.SIGINT, graceful_shutdown)
     signal.signal(signal.SIGTERM, graceful_shutdown)
+    # Reload the configuration and the temperature sensors on SIGHUP (systemctl reload)
+    signal.signal(signal.SIGHUP, request_reload)
 
     try:
         parse_opts()
         parse_config()
+        if not _DEBUG:
+            start_ipmitool_shell()
+        init_sensors()
+        if config['gpu_monitoring']['monitor_nvidia_gpus']:
+            enable_nvidia_persistence_mode()
+            if pynvml is not None:
+                init_nvml()
         main()
     except (getopt.GetoptError, InterruptedError):
         sys.exit(1)
@@ -566,5 +1366,5 @@ if __name__ == "__main__":
             pass
         except Exception as e:
             print(f"Unexpected error in final shutdown: {e}", file=sys.stderr)
-            sensors.cleanup()
+            cleanup_sensors()
             sys.exit(0)
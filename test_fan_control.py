@@ -27,19 +27,22 @@ def test_amd_temperature_function():
     print("Testing AMD temperature function...")
     
     # Import the function after adding to path
-    from fan_control import get_amd_temperatures
+    from fan_control import get_amd_temperatures, init_sensors
     
-    # Mock sensors.get_detected_chips() to return AMD GPU sensors
+    # Mock sensors.get_detected_chips() to return AMD GPU sensors: two temperature
+    # features with an input each, and a power feature that must be skipped
     mock_sensor = MagicMock()
     mock_sensor.prefix = 'amdgpu'
-    mock_sensor.get_features.return_value = [MagicMock()]
-    mock_sensor.get_all_subfeatures.return_value = [
-        MagicMock(name='temp1_input', number=1),
-        MagicMock(name='temp2_input', number=2)
-    ]
-    mock_sensor.get_value.side_effect = lambda x: [45.0, 50.0][x-1]
-    
-    with patch('fan_control.sensors.get_detected_chips', return_value=[mock_sensor]):
+    features = [MagicMock(type=sensors.FEATURE_TEMP), MagicMock(type=sensors.FEATURE_TEMP), MagicMock(type=-1)]
+    mock_sensor.get_features.return_value = features
+    inputs = {id(features[0]): MagicMock(number=1), id(features[1]): MagicMock(number=2), id(features[2]): MagicMock(number=3)}
+    mock_sensor.get_subfeature.side_effect = lambda feature, subfeature_type: (
+        inputs[id(feature)] if subfeature_type == sensors.SUBFEATURE_TEMP_INPUT else None)
+    mock_sensor.get_value.side_effect = lambda x: [45.0, 50.0, 120.0][x-1]
+    
+    with patch('fan_control.sensors.get_detected_chips', return_value=[mock_sensor]), \
+         patch('fan_control.HWMON_PATH', '/nonexistent'):
+        init_sensors()
         temps = get_amd_temperatures()
         print(f"AMD temperatures: {temps}")
         assert len(temps) == 2
@@ -47,24 +50,160 @@ def test_amd_temperature_function():
         assert temps[1] == 50.0
         print("✓ AMD temperature function test passed")
 
+def test_amd_hwmon_temperature_function():
+    """Test the AMD temperature function with a fake hwmon sysfs tree."""
+    print("Testing AMD hwmon temperature function...")
+    
+    from fan_control import get_amd_temperatures, init_sensors
+    
+    with tempfile.TemporaryDirectory() as hwmon_path:
+        for hwmon, name, temps in (('hwmon0', 'coretemp', {'temp1_input': '38000'}),
+                                   ('hwmon1', 'amdgpu', {'temp1_input': '49000', 'temp2_input': '53500',
+                                                         'temp3_input': '200000', 'temp4_input': 'N/A'})):
+            os.mkdir(os.path.join(hwmon_path, hwmon))
+            for filename, content in dict(temps, name=name).items():
+                with open(os.path.join(hwmon_path, hwmon, filename), 'w') as f:
+                    f.write(content + '\n')
+        
+        with patch('fan_control.sensors.get_detected_chips', return_value=[]), \
+             patch('fan_control.HWMON_PATH', hwmon_path):
+            init_sensors()
+            with patch('fan_control.sys.stderr') as mock_stderr:
+                temps = get_amd_temperatures()
+            print(f"AMD hwmon temperatures: {temps}")
+            assert temps == [49.0, 53.5]
+            # Both bad readings are reported with a single write
+            assert mock_stderr.write.call_count == 1
+            assert mock_stderr.write.call_args[0][0].count('Warning:') == 2
+            print("✓ AMD hwmon temperature function test passed")
+
 def test_nvidia_temperature_function():
-    """Test the NVIDIA temperature function with mocked subprocess."""
+    """Test the NVIDIA temperature function with a mocked nvidia-smi loop mode process."""
     print("Testing NVIDIA temperature function...")
     
+    from fan_control import get_nvidia_temperatures, stop_nvidia_smi_stream
+    
+    # Mock nvidia-smi output through a real pipe, so that select() works on it
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"0, 65\n1, 70\n")
+    mock_proc = MagicMock()
+    mock_proc.poll.return_value = None
+    mock_proc.stdout = os.fdopen(read_fd, 'rb')
+    
+    config = {'general': {'debug': False, 'interval': 60}}
+    
+    try:
+        with patch('fan_control.pynvml', None), \
+             patch('fan_control.config', config), \
+             patch('fan_control.subprocess.Popen', return_value=mock_proc) as mock_popen:
+            temps = get_nvidia_temperatures()
+            print(f"NVIDIA temperatures: {temps}")
+            assert len(temps) == 2
+            assert temps[0] == 65
+            assert temps[1] == 70
+            
+            # Later samples update the readings without spawning nvidia-smi again
+            os.write(write_fd, b"0, 66\n1, [N/A]\n")
+            temps = get_nvidia_temperatures()
+            assert temps == [66]
+            assert mock_popen.call_count == 1
+            assert '-lms' in mock_popen.call_args[0][0]
+            print("✓ NVIDIA temperature function test passed")
+    finally:
+        stop_nvidia_smi_stream()
+        os.close(write_fd)
+
+def test_nvidia_smi_restart_delay():
+    """Test that a failing nvidia-smi is not restarted on every poll."""
+    print("Testing nvidia-smi restart delay...")
+    
+    import fan_control
+    
+    def exiting_proc(*args, **kwargs):
+        # nvidia-smi without any GPU exits right away
+        read_fd, write_fd = os.pipe()
+        os.close(write_fd)
+        proc = MagicMock()
+        proc.wait.return_value = 6
+        proc.stdout = os.fdopen(read_fd, 'rb')
+        return proc
+    
+    config = {'general': {'debug': False, 'interval': 60}}
+    
+    with patch('fan_control.pynvml', None), \
+         patch('fan_control.config', config), \
+         patch('fan_control._nvsmi_restart_at', 0.0), \
+         patch('fan_control._nvsmi_restart_delay', 0.0), \
+         patch('fan_control.time.monotonic', return_value=1000.0) as mock_clock, \
+         patch('fan_control.subprocess.Popen', side_effect=exiting_proc) as mock_popen:
+        assert fan_control.get_nvidia_temperatures() == []
+        mock_clock.return_value = 1059.0
+        assert fan_control.get_nvidia_temperatures() == []
+        assert mock_popen.call_count == 1
+        # Restarted after the interval, then the delay doubles
+        mock_clock.return_value = 1060.0
+        assert fan_control.get_nvidia_temperatures() == []
+        assert mock_popen.call_count == 2
+        assert fan_control._nvsmi_restart_at == 1060.0 + 120
+    print("✓ nvidia-smi restart delay test passed")
+
+def test_nvidia_nvml_temperature_function():
+    """Test the NVIDIA temperature function with mocked NVML bindings."""
+    print("Testing NVIDIA NVML temperature function...")
+    
     from fan_control import get_nvidia_temperatures
     
-    # Mock nvidia-smi output
-    mock_result = MagicMock()
-    mock_result.stdout = "65\n70\n"
-    mock_result.stderr = ""
+    # Mock pynvml with two GPUs, one of them reporting an implausible value
+    mock_pynvml = MagicMock()
+    mock_pynvml.NVMLError = type('NVMLError', (Exception,), {})
+    mock_pynvml.nvmlDeviceGetTemperature.side_effect = lambda handle, sensor: {'gpu0': 62, 'gpu1': 200}[handle]
     
-    with patch('fan_control.subprocess.run', return_value=mock_result):
+    with patch('fan_control.pynvml', mock_pynvml), \
+         patch('fan_control._nvml_handles', ['gpu0', 'gpu1']), \
+         patch('fan_control.subprocess.Popen') as mock_popen:
         temps = get_nvidia_temperatures()
-        print(f"NVIDIA temperatures: {temps}")
-        assert len(temps) == 2
-        assert temps[0] == 65
-        assert temps[1] == 70
-        print("✓ NVIDIA temperature function test passed")
+        print(f"NVIDIA NVML temperatures: {temps}")
+        assert temps == [62]
+        mock_popen.assert_not_called()
+        print("✓ NVIDIA NVML temperature function test passed")
+
+def test_nvml_recovery():
+    """Test that a failed or lost NVML session is re-initialized later."""
+    print("Testing NVML recovery...")
+    
+    import fan_control
+    
+    class NVMLError(Exception):
+        def __init__(self, value):
+            self.value = value
+    
+    mock_pynvml = MagicMock()
+    mock_pynvml.NVMLError = NVMLError
+    mock_pynvml.NVML_ERROR_UNINITIALIZED = 1
+    mock_pynvml.NVML_ERROR_GPU_IS_LOST = 15
+    mock_pynvml.nvmlInit.side_effect = [NVMLError(9), None]  # driver not loaded yet, then loaded
+    mock_pynvml.nvmlDeviceGetCount.return_value = 1
+    mock_pynvml.nvmlDeviceGetHandleByIndex.return_value = 'gpu0'
+    mock_pynvml.nvmlDeviceGetTemperature.side_effect = [55, NVMLError(15)]
+    
+    with patch('fan_control.pynvml', mock_pynvml), \
+         patch('fan_control._nvml_handles', None), \
+         patch('fan_control._nvml_retry_at', 0.0), \
+         patch('fan_control.time.monotonic', return_value=100.0) as mock_clock:
+        # Failed initialization is not retried on every poll
+        assert fan_control.get_nvidia_temperatures() == []
+        mock_clock.return_value = 200.0
+        assert fan_control.get_nvidia_temperatures() == []
+        assert mock_pynvml.nvmlInit.call_count == 1
+        # ...but once NVML_RETRY_INTERVAL has passed
+        mock_clock.return_value = 100.0 + fan_control.NVML_RETRY_INTERVAL
+        assert fan_control.get_nvidia_temperatures() == [55]
+        assert mock_pynvml.nvmlInit.call_count == 2
+        # A lost GPU drops the stale handles
+        assert fan_control.get_nvidia_temperatures() == []
+        assert fan_control._nvml_handles is None
+        mock_pynvml.nvmlShutdown.assert_called_once()
+    print("✓ NVML recovery test passed")
 
 def test_gpu_temperature_function():
     """Test the combined GPU temperature function."""
@@ -90,10 +229,31 @@ def test_gpu_temperature_function():
         
         temps = get_gpu_temperatures()
         print(f"Combined temperatures: {temps}")
-        assert len(temps) == 4
-        assert temps == [45, 50, 65, 70]
+        assert len(temps.values) == 4
+        assert temps.values == [45, 50, 65, 70]
+        assert temps.source == 'amd+nvidia'
+        assert not temps.all_zero
         print("✓ Combined GPU temperature function test passed")
 
+def test_gpu_poller_freshness():
+    """Test that the control loop gets the [0] fallback for a stale background GPU reading."""
+    print("Testing GPU poller freshness...")
+    
+    import fan_control
+    from fan_control import GpuTemps
+    
+    reading = GpuTemps([55, 60], False, 'amd')
+    with patch('fan_control._gpu_latest', reading), \
+         patch('fan_control._gpu_latest_at', 100.0), \
+         patch('fan_control.time.monotonic', return_value=200.0) as mock_clock:
+        assert fan_control.latest_gpu_temperatures(120) is reading
+        mock_clock.return_value = 221.0
+        stale = fan_control.latest_gpu_temperatures(120)
+        assert stale.values == [0]
+        assert stale.all_zero
+        assert stale.source == 'stale'
+    print("✓ GPU poller freshness test passed")
+
 def test_config_parsing():
     """Test configuration parsing with new GPU monitoring options."""
     print("Testing configuration parsing...")
@@ -122,9 +282,9 @@ def test_config_parsing():
         # Import and test config parsing
         from fan_control import parse_config, config
         
-        # Temporarily modify config paths
+        # Temporarily modify config paths, the first missing candidates being skipped
         original_config_paths = config['config_paths']
-        config['config_paths'] = [config_file]
+        config['config_paths'] = ['/nonexistent/fan_control.yaml', tempfile.gettempdir(), config_file]
         
         parse_config()
         
@@ -132,6 +292,8 @@ def test_config_parsing():
         assert 'gpu_monitoring' in config
         assert config['gpu_monitoring']['monitor_amd_gpus'] == True
         assert config['gpu_monitoring']['monitor_nvidia_gpus'] == False
+        assert config['general']['interval'] == 1.0
+        assert config['general']['adaptive_interval'] == False
         print("✓ Configuration parsing test passed")
         
     finally:
@@ -139,6 +301,175 @@ def test_config_parsing():
         os.unlink(config_file)
         config['config_paths'] = original_config_paths
 
+def test_interval_options():
+    """Test that the polling interval is validated, and the command line one wins over the config file."""
+    print("Testing interval options...")
+    
+    import getopt
+    import fan_control
+    
+    for bad_interval in ('abc', '0', '-5', 'nan'):
+        with patch('sys.argv', ['fan_control.py', '-i', bad_interval]), \
+             patch('fan_control.cli_general', {}):
+            try:
+                fan_control.parse_opts()
+                assert False, f"Interval '{bad_interval}' should be rejected"
+            except getopt.GetoptError:
+                pass
+    
+    config_file = create_test_config({
+        'general': {'debug': False, 'interval': 60},
+        'host': {'name': 'TestHost', 'temperatures': [55, 60], 'speeds': [13, 17]}
+    })
+    bad_config_file = create_test_config({
+        'general': {'interval': 'fast'},
+        'host': {'name': 'TestHost', 'temperatures': [55, 60], 'speeds': [13, 17]}
+    })
+    try:
+        with patch('sys.argv', ['fan_control.py', '-d', '-i', '2.5', '-c', config_file]), \
+             patch('fan_control.cli_general', {}), \
+             patch('fan_control.config', {'general': {}}), \
+             patch('fan_control.state', {}):
+            fan_control.parse_opts()
+            fan_control.parse_config()
+            assert fan_control.config['general']['interval'] == 2.5
+            assert fan_control.config['general']['debug'] == True
+            
+            fan_control.config['config_paths'] = [bad_config_file]
+            fan_control.cli_general.clear()
+            try:
+                fan_control.parse_config()
+                assert False, "Interval 'fast' should be rejected"
+            except fan_control.ConfigError:
+                pass
+        fan_control.refresh_config_cache()
+    finally:
+        os.unlink(config_file)
+        os.unlink(bad_config_file)
+    print("✓ Interval options test passed")
+
+def test_set_fan_speed_retry():
+    """Test that the fan speed is sent together with the switch to manual mode, and retried if rejected."""
+    print("Testing fan speed retry...")
+    
+    import fan_control
+    
+    # Both commands are sent by a single ipmitool process
+    state = {'fan_control_mode': 'automatic', 'fan_speed': 0}
+    with patch('fan_control.state', state), \
+         patch('fan_control.HOST', fan_control.HostCfg((55, 60), (13, 17), 2, (53, 58))), \
+         patch('fan_control._DEBUG', False), \
+         patch('fan_control.subprocess.check_output') as mock_check_output:
+        fan_control.set_fan_speed(1)
+        assert mock_check_output.call_count == 1
+        assert mock_check_output.call_args[0][0][:2] == ['ipmitool', 'exec']
+        assert state == {'fan_control_mode': 'manual', 'fan_speed': 17}
+    
+    # Separate commands are sent if that fails, retrying the rejected speed without a long sleep
+    state = {'fan_control_mode': 'automatic', 'fan_speed': 0}
+    with patch('fan_control.state', state), \
+         patch('fan_control.HOST', fan_control.HostCfg((55, 60), (13, 17), 2, (53, 58))), \
+         patch('fan_control._DEBUG', True), \
+         patch('fan_control.ipmitool_batch', return_value=False), \
+         patch('fan_control.ipmitool', side_effect=[True, False, True]) as mock_ipmitool, \
+         patch('fan_control.time.sleep') as mock_sleep:
+        fan_control.set_fan_speed(1)
+        assert [c[0][0] for c in mock_ipmitool.call_args_list] == [
+            "raw 0x30 0x30 0x01 0x00",
+            "raw 0x30 0x30 0x02 0xff 0x11",
+            "raw 0x30 0x30 0x02 0xff 0x11",
+        ]
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [0.1]
+        assert state == {'fan_control_mode': 'manual', 'fan_speed': 17}
+    
+    # A speed the BMC keeps rejecting is not recorded as set, so the next tick retries it
+    state = {'fan_control_mode': 'manual', 'fan_speed': 13, 'last_decision': (2, False, 13, 'manual')}
+    with patch('fan_control.state', state), \
+         patch('fan_control.HOST', fan_control.HostCfg((55, 60), (13, 17), 2, (53, 58))), \
+         patch('fan_control._DEBUG', True), \
+         patch('fan_control.ipmitool', return_value=False) as mock_ipmitool, \
+         patch('fan_control.time.sleep') as mock_sleep:
+        fan_control.set_fan_speed(1)
+        assert mock_ipmitool.call_count == fan_control.SET_FAN_SPEED_ATTEMPTS
+        assert mock_sleep.call_count == fan_control.SET_FAN_SPEED_ATTEMPTS - 1
+        assert state == {'fan_control_mode': 'manual', 'fan_speed': 13}
+        print("✓ Fan speed retry test passed")
+
+def test_ipmitool_shell():
+    """Test running the ipmitool commands through a long-running ipmitool shell."""
+    print("Testing ipmitool shell...")
+    
+    import fan_control
+    
+    # Fake ipmitool shell: raw commands of netfn 0x30 succeed, others are rejected by the "BMC"
+    fake_ipmitool = (
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        "log = open(sys.argv[0] + '.log', 'a')\n"
+        "sys.stdout.write('ipmitool> '); sys.stdout.flush()\n"
+        "for line in sys.stdin:\n"
+        "    if line.strip() == 'exit':\n"
+        "        break\n"
+        "    log.write(line); log.flush()\n"
+        "    if not line.startswith('raw 0x30'):\n"
+        "        sys.stdout.write('Unable to send RAW command (rsp=0xc1): Invalid command\\n')\n"
+        "    sys.stdout.write('ipmitool> '); sys.stdout.flush()\n"
+    )
+    with tempfile.TemporaryDirectory() as bin_dir:
+        ipmitool_path = os.path.join(bin_dir, 'ipmitool')
+        with open(ipmitool_path, 'w') as f:
+            f.write(fake_ipmitool)
+        os.chmod(ipmitool_path, 0o755)
+        
+        state = {'fan_control_mode': 'automatic', 'fan_speed': 0}
+        with patch.dict(os.environ, {'PATH': bin_dir + os.pathsep + os.environ['PATH']}), \
+             patch('fan_control.state', state), \
+             patch('fan_control.HOST', fan_control.HostCfg((55, 60), (13, 17), 2, (53, 58))), \
+             patch('fan_control._DEBUG', False), \
+             patch('fan_control.subprocess.check_output') as mock_check_output:
+            fan_control.start_ipmitool_shell()
+            try:
+                assert fan_control._ipmi_shell is not None
+                fan_control.set_fan_speed(1)
+                assert state == {'fan_control_mode': 'manual', 'fan_speed': 17}
+                assert not fan_control.ipmitool("raw 0x06 0x01")
+                mock_check_output.assert_not_called()
+            finally:
+                fan_control.stop_ipmitool_shell()
+            assert fan_control._ipmi_shell is None
+            
+            # A shell killed behind our back: the command is still sent by its own ipmitool
+            fan_control.start_ipmitool_shell()
+            try:
+                fan_control._ipmi_shell.kill()
+                fan_control._ipmi_shell.wait()
+                fan_control.set_fan_control("automatic")
+                assert fan_control._ipmi_shell is None
+                mock_check_output.assert_called_once_with(
+                    ['ipmitool', 'raw', '0x30', '0x30', '0x01', '0x01'], timeout=15)
+                assert state['fan_control_mode'] == 'automatic'
+            finally:
+                fan_control.stop_ipmitool_shell()
+        with open(ipmitool_path + '.log') as f:
+            assert f.read().splitlines() == [
+                "raw 0x30 0x30 0x01 0x00",
+                "raw 0x30 0x30 0x02 0xff 0x11",
+                "raw 0x06 0x01",
+            ]
+    print("✓ ipmitool shell test passed")
+
+def test_ipmitool_credentials_masking():
+    """Test that IPMI credentials are not logged."""
+    print("Testing IPMI credentials masking...")
+    
+    from fan_control import loggable_command
+    
+    cmd = ['ipmitool', '-I', 'lanplus', '-H', 'idrac', '-U', 'root', '-P', 'my secret', 'raw', '0x30']
+    logged = loggable_command(cmd)
+    assert logged == 'ipmitool -I lanplus -H idrac -U ___ -P ___ raw 0x30', logged
+    assert loggable_command(['ipmitool', '-P']) == 'ipmitool -P'
+    print("✓ IPMI credentials masking test passed")
+
 def test_fallback_behavior():
     """Test fallback behavior when no GPUs are detected."""
     print("Testing fallback behavior...")
@@ -159,27 +490,161 @@ def test_fallback_behavior():
         
         temps = get_gpu_temperatures()
         print(f"Fallback temperatures: {temps}")
-        assert temps == [0]  # Should fallback to [0]
+        assert temps.values == [0]  # Should fallback to [0]
+        assert temps.all_zero
+        assert temps.source == 'none'
         print("✓ Fallback behavior test passed")
 
 def test_error_handling():
     """Test error handling in temperature functions."""
     print("Testing error handling...")
     
-    from fan_control import get_amd_temperatures, get_nvidia_temperatures
+    from fan_control import get_amd_temperatures, get_nvidia_temperatures, init_sensors
     
     # Test AMD error handling
-    with patch('fan_control.sensors.get_detected_chips', side_effect=Exception("Sensor error")):
+    with patch('fan_control.sensors.get_detected_chips', side_effect=Exception("Sensor error")), \
+         patch('fan_control.HWMON_PATH', '/nonexistent'):
+        init_sensors()
         temps = get_amd_temperatures()
         assert temps == []
         print("✓ AMD error handling test passed")
     
     # Test NVIDIA error handling
-    with patch('fan_control.subprocess.run', side_effect=Exception("NVIDIA error")):
+    with patch('fan_control.pynvml', None), \
+         patch('fan_control._nvsmi_restart_at', 0.0), \
+         patch('fan_control._nvsmi_restart_delay', 0.0), \
+         patch('fan_control.subprocess.Popen', side_effect=Exception("NVIDIA error")):
         temps = get_nvidia_temperatures()
         assert temps == []
         print("✓ NVIDIA error handling test passed")
 
+def test_repeated_shutdown():
+    """Test that a repeated shutdown releases libsensors only once."""
+    print("Testing repeated shutdown...")
+    
+    import fan_control
+    
+    import threading
+    
+    with patch('fan_control.sensors.cleanup') as mock_cleanup, \
+         patch('fan_control._sensors_inited', True), \
+         patch('fan_control._sensors_lock', threading.Lock()), \
+         patch('fan_control._shutdown_lock_held', False), \
+         patch('fan_control.state', {}):
+        for _ in range(2):
+            try:
+                fan_control.graceful_shutdown(None, None)
+            except SystemExit:
+                pass
+        assert mock_cleanup.call_count == 1
+        # The poller is kept out of the released libraries
+        assert fan_control._sensors_lock.locked()
+    
+    # A GPU poll that does not end in time leaves libsensors and NVML alone
+    busy_lock = threading.Lock()
+    busy_lock.acquire()
+    with patch('fan_control.sensors.cleanup') as mock_cleanup, \
+         patch('fan_control.shutdown_nvml') as mock_shutdown_nvml, \
+         patch('fan_control._sensors_inited', True), \
+         patch('fan_control._sensors_lock', busy_lock), \
+         patch('fan_control._shutdown_lock_held', False), \
+         patch('fan_control.SHUTDOWN_LOCK_TIMEOUT', 0.1), \
+         patch('fan_control.state', {}):
+        try:
+            fan_control.graceful_shutdown(None, None)
+        except SystemExit:
+            pass
+        mock_cleanup.assert_not_called()
+        mock_shutdown_nvml.assert_not_called()
+    print("✓ Repeated shutdown test passed")
+
+def test_config_reload():
+    """Test that SIGHUP reloads the configuration and rebuilds the cached coretemp inputs."""
+    print("Testing configuration reload...")
+    
+    import fan_control
+    
+    chip = MagicMock()
+    chip.prefix = 'coretemp'
+    chip.get_features.return_value = [MagicMock(type=2)]
+    chip.get_subfeature.return_value = MagicMock(number=3)
+    chip.get_value.return_value = 48.0
+    
+    mock_sensors = MagicMock(FEATURE_TEMP=2, SUBFEATURE_TEMP_INPUT=0x200)
+    mock_sensors.get_detected_chips.return_value = [chip]
+    
+    host = {'name': 'TestHost', 'temperatures': [55, 60], 'speeds': [13, 17]}
+    config_file = create_test_config({'general': {'interval': 30}, 'host': host})
+    try:
+        with patch('fan_control.sensors', mock_sensors), \
+             patch('fan_control.HWMON_PATH', '/nonexistent'), \
+             patch('fan_control._coretemp_subs', []), \
+             patch('fan_control.cli_general', {}), \
+             patch('fan_control.config', {'config_paths': [config_file], 'general': {}, 'host': {}}), \
+             patch('fan_control.state', {}), \
+             patch('fan_control.stop_nvidia_smi_stream') as mock_stop_stream:
+            fan_control.parse_config()
+            fan_control.state.update({'fan_control_mode': 'manual', 'fan_speed': 17, 'gpu_temps': [50]})
+            
+            # New speeds are picked up, the running fan state is kept
+            with open(config_file, 'w') as f:
+                yaml.dump({'general': {'interval': 30}, 'host': dict(host, speeds=[20, 40])}, f)
+            fan_control.request_reload()
+            assert fan_control._reload_requested
+            fan_control.reload_config()
+            assert not fan_control._reload_requested
+            assert fan_control.HOST.speeds == (20, 40)
+            assert fan_control.state['fan_control_mode'] == 'manual'
+            assert fan_control.state['fan_speed'] == 17
+            assert fan_control.state['gpu_temps'] == [50]
+            # libsensors is kept as loaded at startup, only the cached inputs are rebuilt
+            mock_sensors.init.assert_not_called()
+            mock_sensors.cleanup.assert_not_called()
+            assert fan_control._coretemp_subs == [(chip, 3)]
+            assert fan_control.get_cpu_temperature_summary() == (48, 48.0)
+            mock_stop_stream.assert_not_called()
+            
+            # A new interval restarts the nvidia-smi stream at that interval
+            with open(config_file, 'w') as f:
+                yaml.dump({'general': {'interval': 10}, 'host': dict(host, speeds=[20, 40])}, f)
+            fan_control.reload_config()
+            assert fan_control.config['general']['interval'] == 10.0
+            mock_stop_stream.assert_called_once()
+            
+            # An invalid file keeps the running configuration
+            with open(config_file, 'w') as f:
+                yaml.dump({'general': {'interval': 30}, 'host': dict(host, speeds=[20])}, f)
+            fan_control.reload_config()
+            assert fan_control.HOST.speeds == (20, 40)
+            assert fan_control.config['host']['speeds'] == [20, 40]
+        fan_control.refresh_config_cache()
+    finally:
+        os.unlink(config_file)
+    print("✓ Configuration reload test passed")
+
+def test_sd_notify():
+    """Test the systemd notifications."""
+    print("Testing systemd notifications...")
+    
+    import socket
+    import fan_control
+    
+    with tempfile.TemporaryDirectory() as socket_dir:
+        address = os.path.join(socket_dir, 'notify')
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as notify_socket:
+            notify_socket.bind(address)
+            with patch.dict(os.environ, {'NOTIFY_SOCKET': address, 'WATCHDOG_USEC': '300000000'}), \
+                 patch('fan_control.config', {'general': {'interval': 60.0}}):
+                fan_control.sd_notify("WATCHDOG=1")
+                assert notify_socket.recv(4096) == b"WATCHDOG=1"
+                fan_control.sd_notify(fan_control.ready_notification())
+                assert notify_socket.recv(4096) == b"READY=1\nWATCHDOG_USEC=240000000"
+    
+    # Nothing to do outside systemd
+    with patch.dict(os.environ, {}, clear=True):
+        fan_control.sd_notify("WATCHDOG=1")
+    print("✓ systemd notifications test passed")
+
 def test_real_hardware_amd_gpu():
     """Test with real AMD GPU hardware if available."""
     print("Testing with real AMD GPU hardware...")
@@ -227,11 +692,23 @@ def run_all_tests():
     
     try:
         test_amd_temperature_function()
+        test_amd_hwmon_temperature_function()
         test_nvidia_temperature_function()
+        test_nvidia_smi_restart_delay()
+        test_nvidia_nvml_temperature_function()
+        test_nvml_recovery()
         test_gpu_temperature_function()
+        test_gpu_poller_freshness()
         test_config_parsing()
+        test_interval_options()
+        test_set_fan_speed_retry()
+        test_ipmitool_shell()
+        test_ipmitool_credentials_masking()
         test_fallback_behavior()
         test_error_handling()
+        test_repeated_shutdown()
+        test_config_reload()
+        test_sd_notify()
         test_real_hardware_amd_gpu()
         
         print("\n🎉 All tests passed! Multi-GPU support is working correctly.")
@@ -272,6 +272,230 @@ def test_custom_weights():
     
     print("✓ Custom weights test passed")
 
+def test_skip_gpu_polling():
+    """Test that GPU polling is only skipped when stable and far from thresholds"""
+    print("Testing GPU polling skip...")
+    
+    fan_control.config = {
+        'general': {'debug': False},
+        'host': {
+            'name': 'Test',
+            'temperatures': [55, 60, 70, 75],
+            'speeds': [13, 17, 25, 37],
+            'hysteresis': 2
+        },
+        'temperature_control': {
+            'cpu_curve': {
+                'temperatures': [55, 60, 70, 75],
+                'speeds': [13, 17, 25, 37],
+                'hysteresis': 2
+            },
+            'gpu_curve': {
+                'temperatures': [65, 70, 80, 85],
+                'speeds': [15, 20, 30, 40],
+                'hysteresis': 3
+            }
+        }
+    }
+    fan_control.state.update({
+        'gpu_temps': [40],
+        'effective_temp': 45,  # 10°C below the first CPU threshold
+        'use_gpu_curve': False,
+        'stable_ticks': 5
+    })
+    
+    assert fan_control.skip_gpu_polling(), "Expected GPU polling to be skipped"
+    
+    fan_control.state['stable_ticks'] = 6
+    assert not fan_control.skip_gpu_polling(), "Expected GPU polling every other tick"
+    
+    fan_control.state['stable_ticks'] = 3
+    assert not fan_control.skip_gpu_polling(), "Expected GPU polling until the speed is stable"
+    
+    fan_control.state.update({'stable_ticks': 5, 'effective_temp': 52})
+    assert not fan_control.skip_gpu_polling(), "Expected GPU polling near a threshold"
+    
+    fan_control.state.update({'effective_temp': 45, 'use_gpu_curve': True})
+    assert fan_control.skip_gpu_polling(), "Expected GPU polling to be skipped on the GPU curve"
+    
+    print("✓ GPU polling skip test passed")
+
+def test_compute_fan_speed_thresholds():
+    """Test threshold lookup and hysteresis in compute_fan_speed"""
+    print("Testing fan speed threshold lookup...")
+    
+    from unittest.mock import patch
+    
+    fan_control.config = {
+        'general': {'debug': False},
+        'host': {
+            'name': 'Test',
+            'temperatures': [55, 60, 70, 75],
+            'speeds': [13, 17, 25, 37],
+            'hysteresis': 2
+        },
+        'temperature_control': {
+            'cpu_curve': {
+                'temperatures': [55, 60, 70, 75],
+                'speeds': [13, 17, 25, 37],
+                'hysteresis': 2
+            },
+            'gpu_curve': {
+                'temperatures': [65, 70, 80, 85],
+                'speeds': [15, 20, 30, 40],
+                'hysteresis': 3
+            }
+        }
+    }
+    fan_control.refresh_config_cache()
+    assert fan_control.HOST.speeds == (13, 17, 25, 37)
+    assert fan_control.HOST.release_temps == (53, 58, 68, 73)
+    
+    def selected(temp, use_gpu_curve=False, fan_speed=13, mode='manual'):
+        fan_control.state.update({'fan_speed': fan_speed, 'fan_control_mode': mode})
+        with patch('fan_control.set_fan_speed') as set_fan_speed, \
+             patch('fan_control.set_fan_control') as set_fan_control:
+            fan_control.compute_fan_speed(temp, use_gpu_curve)
+        if set_fan_control.called:
+            return 'automatic'
+        return set_fan_speed.call_args[0][0] if set_fan_speed.called else None
+    
+    assert selected(40) == 0
+    assert selected(55) == 0, "Threshold temperature must select its own speed"
+    assert selected(56) == 1
+    assert selected(75) == 3
+    assert selected(76) == 'automatic'
+    assert selected(76, use_gpu_curve=True) == 2
+    # Coming down from a higher speed, the temperature must drop below threshold - hysteresis
+    assert selected(59, fan_speed=25) == 2
+    assert selected(58, fan_speed=25) == 1
+    assert selected(74, mode='automatic') == None
+    
+    # Unchanged decision inputs skip the lookup, even if the temperature moved a little
+    assert selected(64) == 2
+    assert selected(66) == None
+    assert selected(64, fan_speed=25) == 2
+    # ...but crossing a release temperature within a threshold band does not
+    assert selected(69, fan_speed=37) == 3
+    assert selected(68, fan_speed=37) == 2
+    
+    print("✓ Fan speed threshold lookup test passed")
+
+def test_pick_band():
+    """Test the side-effect free threshold lookup"""
+    print("Testing threshold lookup...")
+    
+    temps, release_temps, speeds = (55, 60, 70, 75), (53, 58, 68, 73), (13, 17, 25, 37)
+    
+    def pick(temp, fan_speed=13, manual=True):
+        return fan_control.pick_band(temp, temps, release_temps, speeds, fan_speed, manual)
+    
+    assert pick(40) == 0
+    assert pick(55) == 0
+    assert pick(75) == 3
+    assert pick(76) == -1, "Expected automatic mode above the highest threshold"
+    assert pick(59, fan_speed=25) == 2
+    assert pick(58, fan_speed=25) == 1
+    assert pick(74, manual=False) == 4, "Expected the fans to stay in automatic mode within the hysteresis"
+    assert pick(72, manual=False) == 3
+    
+    print("✓ Threshold lookup test passed")
+
+def test_adaptive_poll_interval():
+    """Test that the poll interval shrinks while the temperature changes quickly"""
+    print("Testing adaptive poll interval...")
+    
+    import collections
+    from unittest.mock import patch
+    
+    fan_control.config = {
+        'general': {'debug': False, 'interval': 60, 'adaptive_interval': True, 'min_interval': 5}
+    }
+    fan_control.state['temp_history'] = collections.deque(maxlen=fan_control.TEMP_HISTORY_SIZE)
+    
+    def poll(now, temp):
+        with patch('fan_control.time.monotonic', return_value=now):
+            return fan_control.next_poll_interval(temp)
+    
+    assert poll(0, 50) == 60, "Expected the configured interval without history"
+    assert poll(60, 50) == 60, "Expected the configured interval at a steady temperature"
+    assert poll(120, 62) == 60 / (1 + 0.2 * 2), "Expected a shorter interval while heating up"
+    assert poll(122, 92) == 5, "Expected the minimum interval during a fast transient"
+    
+    fan_control.config['general']['adaptive_interval'] = False
+    assert poll(130, 40) == 60, "Expected the configured interval when disabled"
+    
+    print("✓ Adaptive poll interval test passed")
+
+def test_tick_deadlines():
+    """Test that the ticks follow their deadlines, whatever time they take"""
+    print("Testing tick deadlines...")
+    
+    from unittest.mock import patch
+    
+    with patch('fan_control.time.monotonic', return_value=100.7) as mock_clock, \
+         patch('fan_control.select.select', return_value=([], [], [])) as mock_select, \
+         patch('fan_control._tick_overrun_reported', False):
+        # A tick that took 0.7s only sleeps for the rest of the interval
+        assert fan_control.wait_next_tick(100, 60) == 160
+        assert abs(mock_select.call_args[0][3] - 59.3) < 1e-9
+        # A tick that took 130s skips the two missed ticks
+        mock_clock.return_value = 290
+        assert fan_control.wait_next_tick(160, 60) == 340
+        assert mock_select.call_args[0][3] == 50
+        assert fan_control._tick_overrun_reported
+    
+    # A reload request does not wait for the next tick (time.monotonic is the patched clock)
+    import time
+    with patch('fan_control.time.monotonic', return_value=100.7), \
+         patch('fan_control._reload_requested', False):
+        fan_control.request_reload()
+        fan_control.request_reload()
+        started = time.perf_counter()
+        assert fan_control.wait_next_tick(100, 60) == 160
+        assert time.perf_counter() - started < 5
+        try:
+            os.read(fan_control._wakeup_read, 1)
+            assert False, "The wakeup pipe should have been drained"
+        except BlockingIOError:
+            pass
+    
+    print("✓ Tick deadlines test passed")
+
+def test_temperature_rounding():
+    """Test that averages and blends round half to even, as exact integer arithmetic would"""
+    print("Testing temperature rounding...")
+    
+    fan_control.config = {
+        'general': {'debug': False},
+        'temperature_control': {'cpu_weight': 0.5, 'gpu_weight': 0.5}
+    }
+    
+    def half_even(numerator, denominator):
+        quotient, remainder = divmod(numerator, denominator)
+        if 2 * remainder > denominator or (2 * remainder == denominator and quotient % 2):
+            quotient += 1
+        return quotient
+    
+    for a in range(126):
+        for b in range(126):
+            assert fan_control.summarize_temperatures([a, b, b]) == (half_even(a + 2 * b, 3), max(a, b))
+            if abs(a - b) <= 10:
+                effective_temp, _, debug_info = fan_control.calculate_effective_temperature(a, a, [b])
+                assert debug_info['decision'] == 'balanced'
+                assert effective_temp == half_even(a + b, 2), f"Blend of {a} and {b} is {effective_temp}"
+    # The CPU readings are summarized while they are read, the same way
+    from unittest.mock import MagicMock, patch
+    chip = MagicMock()
+    chip.get_value.side_effect = [61, 62, 200, 0]
+    with patch('fan_control._coretemp_subs', [(chip, n) for n in range(4)]):
+        assert fan_control.get_cpu_temperature_summary() == fan_control.summarize_temperatures([61, 62, 0])
+    # Not the same as rounding half up, which would move these by one degree
+    assert fan_control.summarize_temperatures([60, 61])[0] == 60
+    assert fan_control.summarize_temperatures([61, 62])[0] == 62
+    
+    print("✓ Temperature rounding test passed")
+
 def run_all_tests():
     """Run all tests"""
     print("Running temperature algorithm tests...\n")
@@ -283,6 +507,12 @@ def run_all_tests():
         test_no_gpus()
         test_backward_compatibility()
         test_custom_weights()
+        test_skip_gpu_polling()
+        test_compute_fan_speed_thresholds()
+        test_pick_band()
+        test_adaptive_poll_interval()
+        test_tick_deadlines()
+        test_temperature_rounding()
         
         print("\n🎉 All tests passed! The improved temperature algorithm is working correctly.")
         return True